@@ -43,6 +43,13 @@ MQTT_MSG_SZ_LIM = const(10000000)
 MQTT_TOPIC_LENGTH_LIMIT = const(65535)
 MQTT_TCP_PORT = const(1883)
 MQTT_TLS_PORT = const(8883)
+MQTT_TOPIC_CACHE_SZ = const(32)
+MQTT_RX_BUF_SZ = const(256)
+MQTT_RX_LARGE_MAX = const(4096)
+MQTT_TX_BUF_SZ = const(128)
+MQTT_BATCH_SZ = const(1400)
+MQTT_MAX_BACKOFF = const(30)
+MQTT_SOCK_RCVBUF = const(4096)
 
 # MQTT Commands
 MQTT_PINGREQ = b"\xc0\0"
@@ -51,17 +58,20 @@ MQTT_SUB = b"\x82"
 MQTT_UNSUB = b"\xA2"
 MQTT_DISCONNECT = b"\xe0\0"
 
-# Variable CONNECT header [MQTT 3.1.2]
-MQTT_HDR_CONNECT = bytearray(b"\x04MQTT\x04\x02\0\0")
+# Variable CONNECT header [MQTT 3.1.2]: protocol name, protocol level,
+# connect flags and keep alive
+MQTT_HDR_CONNECT = b"\0\x04MQTT\x04\0\0\0"
 
 
-CONNACK_ERRORS = {
-    const(0x01): "Connection Refused - Incorrect Protocol Version",
-    const(0x02): "Connection Refused - ID Rejected",
-    const(0x03): "Connection Refused - Server unavailable",
-    const(0x04): "Connection Refused - Incorrect username/password",
-    const(0x05): "Connection Refused - Unauthorized",
-}
+# CONNACK return codes [MQTT 3.2.2.3], indexed by code
+CONNACK_ERRORS = (
+    None,
+    "Connection Refused - Incorrect Protocol Version",
+    "Connection Refused - ID Rejected",
+    "Connection Refused - Server unavailable",
+    "Connection Refused - Incorrect username/password",
+    "Connection Refused - Unauthorized",
+)
 
 _default_sock = None  # pylint: disable=invalid-name
 _fake_context = None  # pylint: disable=invalid-name
@@ -117,15 +127,72 @@ class _FakeSSLContext:
         return _FakeSSLSocket(socket, self._iface.TLS_MODE)
 
 
+def _encode_remlen(remaining_length, buf, offset):
+    """Encodes an MQTT Remaining Length [2.2.3] into a buffer.
+    Returns the number of bytes written, from 1 to 4.
+
+    :param int remaining_length: Remaining Length to encode.
+    :param bytearray buf: Buffer to write into.
+    :param int offset: Position in the buffer to start writing at.
+    """
+    # Unrolled, a Remaining Length is at most 4 bytes long
+    if remaining_length < 0x80:
+        buf[offset] = remaining_length
+        return 1
+    buf[offset] = (remaining_length & 0x7F) | 0x80
+    if remaining_length < 0x4000:
+        buf[offset + 1] = remaining_length >> 7
+        return 2
+    buf[offset + 1] = (remaining_length >> 7 & 0x7F) | 0x80
+    if remaining_length < 0x200000:
+        buf[offset + 2] = remaining_length >> 14
+        return 3
+    buf[offset + 2] = (remaining_length >> 14 & 0x7F) | 0x80
+    buf[offset + 3] = remaining_length >> 21
+    return 4
+
+
+def _remlen_size(remaining_length):
+    """Returns the number of bytes taken by an encoded MQTT Remaining Length.
+
+    :param int remaining_length: Remaining Length to encode.
+    """
+    return (
+        1
+        + (remaining_length > 0x7F)
+        + (remaining_length > 0x3FFF)
+        + (remaining_length > 0x1FFFFF)
+    )
+
+
+def _to_bytes(value):
+    """Converts a message payload to the bytes sent on the wire. Strings are
+    encoded as UTF-8, numbers are sent as their string form and buffers as they are.
+
+    :param str|int|float|bytes|bytearray|memoryview value: Payload to convert.
+    """
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return value
+    if isinstance(value, (bool, float)):
+        return str(value).encode("ascii")
+    if isinstance(value, int):
+        # bytes formatting skips the intermediate str
+        return b"%d" % value
+    raise MMQTTException("Invalid message data type.")
+
+
 class MQTT:
     """MQTT Client for CircuitPython.
 
     :param str broker: MQTT Broker URL or IP Address.
     :param int port: Optional port definition, defaults to 8883.
-    :param str username: Username for broker authentication.
-    :param str password: Password for broker authentication.
+    :param str|bytes username: Username for broker authentication.
+    :param str|bytes password: Password for broker authentication.
     :param network_manager: NetworkManager object, such as WiFiManager from ESPSPI_WiFiManager.
-    :param str client_id: Optional client identifier, defaults to a unique, generated string.
+    :param str|bytes client_id: Optional client identifier, defaults to a unique,
+        generated string.
     :param bool is_ssl: Sets a secure or insecure connection with the broker.
     :param int keep_alive: KeepAlive interval between the broker and the MiniMQTT client.
     :param int recv_timeout: receive timeout, in seconds.
@@ -135,10 +202,16 @@ class MQTT:
     :param int socket_timeout: How often to check socket state for read/write/connect operations,
         in seconds.
     :param int connect_retries: How many times to try to connect to broker before giving up.
+        `connect()` retries immediately. `reconnect()` spaces the attempts with an
+        exponential backoff, from 1 up to 30 seconds, so with the default of 5 retries
+        it sleeps for up to 15 seconds (1 + 2 + 4 + 8) on top of the socket timeouts.
+    :param bool tcp_nodelay: Disables Nagle's algorithm on the broker socket, so small
+        control packets are not held back, where the socket pool supports it.
 
     """
 
     # pylint: disable=too-many-arguments,too-many-instance-attributes, not-callable, invalid-name, no-member
+    # pylint: disable=too-many-statements
     def __init__(
         self,
         broker,
@@ -154,12 +227,15 @@ class MQTT:
         use_binary_mode=False,
         socket_timeout=1,
         connect_retries=5,
+        tcp_nodelay=True,
     ):
 
         self._socket_pool = socket_pool
         self._ssl_context = ssl_context
         self._sock = None
+        self._cur_timeout = None
         self._backwards_compatible_sock = False
+        self._use_sendmsg = False
         self._use_binary_mode = use_binary_mode
 
         if recv_timeout <= socket_timeout:
@@ -169,6 +245,9 @@ class MQTT:
         self._socket_timeout = socket_timeout
         self._recv_timeout = recv_timeout
         self._connect_retries = connect_retries
+        self._tcp_nodelay = tcp_nodelay
+        # Set while reconnect() runs, to back off between connection attempts
+        self._reconnecting = False
 
         self.keep_alive = keep_alive
         self._user_data = None
@@ -177,14 +256,31 @@ class MQTT:
         self._pid = 0
         self._timestamp = 0
         self.logger = None
+        # Last CONNECT packet, with the (clean_session, keep_alive) it was built for
+        self._connect_packet = None
+        self._connect_packet_key = None
+        # PUBACK packet, only the packet id changes between sends
+        self._puback = bytearray(b"\x40\x02\0\0")
+        # Read-ahead receive buffer, bytes in [_rx_pos, _rx_end) are pending
+        self._rx_buf = bytearray(MQTT_RX_BUF_SZ)
+        self._rx_view = memoryview(self._rx_buf)
+        self._rx_pos = 0
+        self._rx_end = 0
+        # Receive buffer for messages larger than the read-ahead buffer, up to
+        # MQTT_RX_LARGE_MAX bytes. Larger messages get a buffer of their own.
+        self._rx_large = None
+        # Transmit buffer for small PUBLISH packets
+        self._tx_buf = bytearray(MQTT_TX_BUF_SZ)
+        self._tx_view = memoryview(self._tx_buf)
 
         self.broker = broker
-        self._username = username
-        self._password = password
-        if (
-            self._password and len(password.encode("utf-8")) > MQTT_TOPIC_LENGTH_LIMIT
-        ):  # [MQTT-3.1.3.5]
-            raise MMQTTException("Password length is too large.")
+        # Credentials as given, and their length-prefixed UTF-8 encodings
+        # used by every CONNECT
+        self._username = None
+        self._password = None
+        self._username_enc = None
+        self._password_enc = None
+        self.username_pw_set(username, password)
 
         self.port = MQTT_TCP_PORT
         if is_ssl:
@@ -198,13 +294,12 @@ class MQTT:
             # non-alpha-numeric characters
             self.client_id = client_id
         else:
-            # assign a unique client_id
-            self.client_id = "cpy{0}{1}".format(
-                randint(0, int(time.monotonic() * 100) % 1000), randint(0, 99)
-            )
+            # assign a unique client_id, built as bytes so it needs no encoding
+            client_id = b"cpy%d" % randint(0, 99999)
             # generated client_id's enforce spec.'s length rules
-            if len(self.client_id.encode("utf-8")) > 23 or not self.client_id:
+            if not 0 < len(client_id) <= 23:
                 raise ValueError("MQTT Client ID must be between 1 and 23 bytes")
+            self.client_id = client_id
 
         # LWT
         self._lw_topic = None
@@ -212,10 +307,17 @@ class MQTT:
         self._lw_topic = None
         self._lw_msg = None
         self._lw_retain = False
+        self._lw_topic_enc = None
+        self._lw_msg_enc = None
 
         # List of subscribed topics, used for tracking
         self._subscribed_topics = []
+        # Topic filters, each mapped to a (callback, zero_copy) pair
         self._on_message_filtered = MQTTMatcher()
+        # Recently received topics, mapping the raw topic name to its
+        # decoded form and the (callback, zero_copy) pairs matching it
+        self._topic_cache = {}
+        self._topic_cache_order = []
 
         # Default topic callback methods
         self._on_message = None
@@ -226,17 +328,19 @@ class MQTT:
         self.on_unsubscribe = None
 
     # pylint: disable=too-many-branches
-    def _get_connect_socket(self, host, port, *, timeout=1):
+    def _get_connect_socket(self, host, port, *, timeout=1, backoff=False):
         """Obtains a new socket and connects to a broker.
 
         :param str host: Desired broker hostname
         :param int port: Desired broker port
         :param int timeout: Desired socket timeout, in seconds
+        :param bool backoff: Wait between attempts, with an exponential backoff
         """
         # For reconnections - check if we're using a socket already and close it
         if self._sock:
             self._sock.close()
             self._sock = None
+        self._rx_pos = self._rx_end = 0
 
         # Legacy API - use the interface's socket instead of a passed socket pool
         if self._socket_pool is None:
@@ -271,12 +375,19 @@ class MQTT:
         retry_count = 0
         last_exception = None
         while retry_count < self._connect_retries and sock is None:
+            if retry_count and backoff:
+                # Back off exponentially instead of hammering the broker
+                delay = min(1 << (retry_count - 1), MQTT_MAX_BACKOFF)
+                if self.logger is not None:
+                    self.logger.debug("Retrying connection in {} seconds".format(delay))
+                time.sleep(delay)
             retry_count += 1
 
             try:
                 sock = self._socket_pool.socket(addr_info[0], addr_info[1])
             except OSError:
                 continue
+            self._set_socket_options(sock)
 
             connect_host = addr_info[-1][0]
             if port == 8883:
@@ -302,43 +413,49 @@ class MQTT:
             raise RuntimeError("Repeated socket failures")
 
         self._backwards_compatible_sock = not hasattr(sock, "recv_into")
+        # Cleared on first use if sendmsg() turns out to be unsupported
+        self._use_sendmsg = hasattr(sock, "sendmsg")
+        self._cur_timeout = timeout
         return sock
 
+    def _set_socket_options(self, sock):
+        """Tunes a new socket for MQTT traffic, where supported by the socket pool.
+
+        :param sock: Socket to configure, before it is connected.
+        """
+        pool = self._socket_pool
+        if not hasattr(sock, "setsockopt"):
+            return
+        # Disable Nagle's algorithm, small packets should go out right away
+        if (
+            self._tcp_nodelay
+            and hasattr(pool, "IPPROTO_TCP")
+            and hasattr(pool, "TCP_NODELAY")
+        ):
+            try:
+                sock.setsockopt(pool.IPPROTO_TCP, pool.TCP_NODELAY, 1)
+            except OSError as error:
+                if self.logger is not None:
+                    self.logger.debug("Unable to set TCP_NODELAY: {}".format(error))
+        # Let the stack buffer bursts of packets, so one read drains several.
+        # Only ever grow the buffer, desktop stacks default to a larger one.
+        if hasattr(pool, "SOL_SOCKET") and hasattr(pool, "SO_RCVBUF"):
+            try:
+                rcvbuf = 0
+                if hasattr(sock, "getsockopt"):
+                    rcvbuf = sock.getsockopt(pool.SOL_SOCKET, pool.SO_RCVBUF)
+                if rcvbuf < MQTT_SOCK_RCVBUF:
+                    sock.setsockopt(pool.SOL_SOCKET, pool.SO_RCVBUF, MQTT_SOCK_RCVBUF)
+            except OSError as error:
+                if self.logger is not None:
+                    self.logger.debug("Unable to set SO_RCVBUF: {}".format(error))
+
     def __enter__(self):
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
         self.deinit()
 
-    def _sock_exact_recv(self, bufsize):
-        """Reads _exact_ number of bytes from the connected socket. Will only return
-        string with the exact number of bytes requested.
-
-        The semantics of native socket receive is that it returns no more than the
-        specified number of bytes (i.e. max size). However, it makes no guarantees in
-        terms of the minimum size of the buffer, which could be 1 byte. This is a
-        wrapper for socket recv() to ensure that no less than the expected number of
-        bytes is returned or trigger a timeout exception.
-
-        :param int bufsize: number of bytes to receive
-        """
-        stamp = time.monotonic()
-        rc = self._sock.recv(bufsize)
-        to_read = bufsize - len(rc)
-        assert to_read >= 0
-        read_timeout = self.keep_alive
-        while to_read > 0:
-            recv = self._sock.recv(to_read)
-            to_read -= len(recv)
-            rc += recv
-            if time.monotonic() - stamp > read_timeout:
-                raise MMQTTException(
-                    "Unable to receive {} bytes within {} seconds.".format(
-                        to_read, read_timeout
-                    )
-                )
-        return rc
-
     def deinit(self):
         """De-initializes the MQTT client and disconnects from the mqtt broker."""
         self.disconnect()
@@ -361,7 +478,7 @@ class MQTT:
         """Sets the last will and testament properties. MUST be called before `connect()`.
 
         :param str topic: MQTT Broker topic.
-        :param int|float|str payload: Last will disconnection payload.
+        :param int|float|str|bytes payload: Last will disconnection payload.
             payloads of type int & float are converted to a string.
         :param int qos: Quality of Service level, defaults to
             zero. Conventional options are ``0`` (send at most once), ``1``
@@ -377,25 +494,47 @@ class MQTT:
         if self._is_connected:
             raise MMQTTException("Last Will should only be called before connect().")
         if payload is None:
-            payload = ""
-        if isinstance(payload, (int, float, str)):
-            payload = str(payload).encode()
-        else:
-            raise MMQTTException("Invalid message data type.")
+            payload = b""
+        payload = _to_bytes(payload)
         self._lw_qos = qos
         self._lw_topic = topic
         self._lw_msg = payload
         self._lw_retain = retain
+        self._lw_topic_enc = self._encode_str(topic)
+        self._lw_msg_enc = self._encode_str(payload)
+        self._connect_packet = None
+
+    @property
+    def client_id(self):
+        """MQTT client identifier. Changes take effect on the next `connect()`.
+        May be set to UTF-8 encoded bytes, it is always returned as a string.
+        """
+        if isinstance(self._client_id, bytes):
+            return str(self._client_id, "utf-8")
+        return self._client_id
+
+    @client_id.setter
+    def client_id(self, client_id):
+        self._client_id = client_id
+        self._client_id_enc = self._encode_str(client_id)
+        self._connect_packet = None
 
-    def add_topic_callback(self, mqtt_topic, callback_method):
+    def add_topic_callback(self, mqtt_topic, callback_method, zero_copy=False):
         """Registers a callback_method for a specific MQTT topic.
 
         :param str mqtt_topic: MQTT topic identifier.
         :param function callback_method: The callback method.
+        :param bool zero_copy: Pass the message to the callback as a read-only
+            buffer (usually a memoryview into the receive buffer) instead of a
+            new str or bytearray. The buffer is only valid until the callback returns.
+            Neither the callback nor the ones matching a message before it may
+            publish, subscribe or otherwise use the client, as that reuses the
+            receive buffer.
         """
         if mqtt_topic is None or callback_method is None:
             raise ValueError("MQTT topic and callback method must both be defined.")
-        self._on_message_filtered[mqtt_topic] = callback_method
+        self._on_message_filtered[mqtt_topic] = (callback_method, zero_copy)
+        self._clear_topic_cache()
 
     def remove_topic_callback(self, mqtt_topic):
         """Removes a registered callback method.
@@ -410,6 +549,7 @@ class MQTT:
             raise KeyError(
                 "MQTT topic callback not added with add_topic_callback."
             ) from None
+        self._clear_topic_cache()
 
     @property
     def on_message(self):
@@ -423,28 +563,81 @@ class MQTT:
     def on_message(self, method):
         self._on_message = method
 
-    def _handle_on_message(self, client, topic, message):
-        matched = False
-        if topic is not None:
-            for callback in self._on_message_filtered.iter_match(topic):
-                callback(client, topic, message)  # on_msg with callback
-                matched = True
-
-        if not matched and self.on_message:  # regular on_message
-            self.on_message(client, topic, message)
+    def _handle_on_message(self, client, topic, raw_msg, callbacks):
+        # raw_msg is a view into the receive buffer, which any client I/O done
+        # by a callback overwrites. Decode the message before calling anything,
+        # only zero-copy callbacks are given the view.
+        message = None
+        for callback, zero_copy in callbacks:
+            if not zero_copy:
+                message = self._decode_msg(raw_msg)
+                break
+        for callback, zero_copy in callbacks:  # on_msg with callback
+            callback(client, topic, raw_msg if zero_copy else message)
+
+        # regular on_message, read from the attribute to skip the property call
+        on_message = self._on_message
+        if not callbacks and on_message:
+            on_message(client, topic, self._decode_msg(raw_msg))
+
+    def _decode_msg(self, raw_msg):
+        """Converts a received message to the type passed to callbacks.
+
+        :param raw_msg: Message buffer as received from the broker.
+        """
+        if not self._use_binary_mode:
+            return str(raw_msg, "utf-8")
+        if isinstance(raw_msg, memoryview):
+            return bytearray(raw_msg)
+        return raw_msg
+
+    def _lookup_topic(self, raw_topic):
+        """Decodes a received topic name and finds the callbacks matching it,
+        paired with whether they take the message zero-copy. Results are
+        cached for the most recently seen topics.
+
+        :param bytes raw_topic: Topic name as received from the broker.
+        """
+        raw_topic = bytes(raw_topic)
+        entry = self._topic_cache.get(raw_topic)
+        if entry is None:
+            topic = str(raw_topic, "utf-8")
+            entry = (topic, tuple(self._on_message_filtered.iter_match(topic)))
+            if len(self._topic_cache_order) >= MQTT_TOPIC_CACHE_SZ:
+                del self._topic_cache[self._topic_cache_order.pop(0)]
+            self._topic_cache[raw_topic] = entry
+            self._topic_cache_order.append(raw_topic)
+        return entry
+
+    def _clear_topic_cache(self):
+        self._topic_cache = {}
+        self._topic_cache_order = []
 
     def username_pw_set(self, username, password=None):
         """Set client's username and an optional password.
 
-        :param str username: Username to use with your MQTT broker.
-        :param str password: Password to use with your MQTT broker.
+        :param str|bytes username: Username to use with your MQTT broker.
+        :param str|bytes password: Password to use with your MQTT broker.
 
         """
         if self._is_connected:
             raise MMQTTException("This method must be called before connect().")
-        self._username = username
+        username_bytes = username
+        if isinstance(username, str):
+            username_bytes = username.encode("utf-8")
+        if username_bytes is not None and len(username_bytes) > MQTT_TOPIC_LENGTH_LIMIT:
+            raise MMQTTException("Username length is too large.")  # [MQTT-3.1.3.4]
         if password is not None:
+            password_bytes = password
+            if isinstance(password, str):
+                password_bytes = password.encode("utf-8")
+            if len(password_bytes) > MQTT_TOPIC_LENGTH_LIMIT:  # [MQTT-3.1.3.5]
+                raise MMQTTException("Password length is too large.")
             self._password = password
+            self._password_enc = self._encode_str(password_bytes)
+        self._username = username
+        self._username_enc = self._encode_str(username_bytes)
+        self._connect_packet = None
 
     # pylint: disable=too-many-branches, too-many-statements, too-many-locals
     def connect(self, clean_session=True, host=None, port=None, keep_alive=None):
@@ -468,75 +661,22 @@ class MQTT:
 
         # Get a new socket
         self._sock = self._get_connect_socket(
-            self.broker, self.port, timeout=self._socket_timeout
+            self.broker,
+            self.port,
+            timeout=self._socket_timeout,
+            backoff=self._reconnecting,
         )
 
-        # Fixed Header
-        fixed_header = bytearray([0x10])
-
-        # NOTE: Variable header is
-        # MQTT_HDR_CONNECT = bytearray(b"\x04MQTT\x04\x02\0\0")
-        # because final 4 bytes are 4, 2, 0, 0
-        var_header = MQTT_HDR_CONNECT
-        var_header[6] = clean_session << 1
-
-        # Set up variable header and remaining_length
-        remaining_length = 12 + len(self.client_id.encode("utf-8"))
-        if self._username:
-            remaining_length += (
-                2
-                + len(self._username.encode("utf-8"))
-                + 2
-                + len(self._password.encode("utf-8"))
-            )
-            var_header[6] |= 0xC0
-        if self.keep_alive:
-            assert self.keep_alive < MQTT_TOPIC_LENGTH_LIMIT
-            var_header[7] |= self.keep_alive >> 8
-            var_header[8] |= self.keep_alive & 0x00FF
-        if self._lw_topic:
-            remaining_length += (
-                2 + len(self._lw_topic.encode("utf-8")) + 2 + len(self._lw_msg)
-            )
-            var_header[6] |= 0x4 | (self._lw_qos & 0x1) << 3 | (self._lw_qos & 0x2) << 3
-            var_header[6] |= self._lw_retain << 5
-
-        # Remaining length calculation
-        large_rel_length = False
-        if remaining_length > 0x7F:
-            large_rel_length = True
-            # Calculate Remaining Length [2.2.3]
-            while remaining_length > 0:
-                encoded_byte = remaining_length % 0x80
-                remaining_length = remaining_length // 0x80
-                # if there is more data to encode, set the top bit of the byte
-                if remaining_length > 0:
-                    encoded_byte |= 0x80
-                fixed_header.append(encoded_byte)
-        if large_rel_length:
-            fixed_header.append(0x00)
-        else:
-            fixed_header.append(remaining_length)
-            fixed_header.append(0x00)
-
         if self.logger is not None:
             self.logger.debug("Sending CONNECT to broker...")
-            self.logger.debug(
-                "Fixed Header: %s\nVariable Header: %s", fixed_header, var_header
-            )
-        self._sock.send(fixed_header)
-        self._sock.send(var_header)
-        # [MQTT-3.1.3-4]
-        self._send_str(self.client_id)
-        if self._lw_topic:
-            # [MQTT-3.1.3-11]
-            self._send_str(self._lw_topic)
-            self._send_str(self._lw_msg)
-        if self._username is None:
-            self._username = None
-        else:
-            self._send_str(self._username)
-            self._send_str(self._password)
+        # The packet only changes with the client settings, reuse it on reconnects
+        if self._connect_packet is None or self._connect_packet_key != (
+            clean_session,
+            self.keep_alive,
+        ):
+            self._connect_packet = self._build_connect(clean_session)
+            self._connect_packet_key = (clean_session, self.keep_alive)
+        self._sock.send(self._connect_packet)
         if self.logger is not None:
             self.logger.debug("Receiving CONNACK packet from broker")
         stamp = time.monotonic()
@@ -544,9 +684,16 @@ class MQTT:
             op = self._wait_for_msg()
             if op == 32:
                 rc = self._sock_exact_recv(3)
-                assert rc[0] == 0x02
+                if rc[0] != 0x02:
+                    raise MMQTTException(
+                        "Unexpected CONNACK length from broker: {}.".format(rc[0])
+                    )
                 if rc[2] != 0x00:
-                    raise MMQTTException(CONNACK_ERRORS[rc[2]])
+                    if rc[2] < len(CONNACK_ERRORS):
+                        raise MMQTTException(CONNACK_ERRORS[rc[2]])
+                    raise MMQTTException(
+                        "Connection Refused - Unknown return code {}".format(rc[2])
+                    )
                 self._is_connected = True
                 result = rc[0] & 1
                 if self.on_connect is not None:
@@ -559,6 +706,47 @@ class MQTT:
                         f"No data received from broker for {self._recv_timeout} seconds."
                     )
 
+    def _build_connect(self, clean_session):
+        """Assembles a CONNECT packet from the current client settings.
+
+        :param bool clean_session: Establishes a persistent session.
+
+        """
+        flags = clean_session << 1
+        if self.keep_alive >= MQTT_TOPIC_LENGTH_LIMIT:
+            raise MMQTTException("Keep alive interval is too large.")
+
+        # Payload fields [MQTT 3.1.3], each one already length-prefixed
+        fields = [self._client_id_enc]  # [MQTT-3.1.3-4]
+        if self._lw_topic:
+            # [MQTT-3.1.3-11]
+            flags |= 0x4 | (self._lw_qos & 0x3) << 3 | self._lw_retain << 5
+            fields.append(self._lw_topic_enc)
+            fields.append(self._lw_msg_enc)
+        if self._username_enc is not None:
+            flags |= 0x80
+            fields.append(self._username_enc)
+            if self._password_enc is not None:
+                flags |= 0x40
+                fields.append(self._password_enc)
+
+        # Fixed header, then the variable header [MQTT 3.1.2] and payload,
+        # written in place into a single buffer
+        remaining_length = len(MQTT_HDR_CONNECT)
+        for field in fields:
+            remaining_length += len(field)
+        packet = bytearray(1 + _remlen_size(remaining_length) + remaining_length)
+        packet[0] = 0x10
+        offset = 1 + _encode_remlen(remaining_length, packet, 1)
+        packet[offset : offset + len(MQTT_HDR_CONNECT)] = MQTT_HDR_CONNECT
+        # connect flags and keep alive, after the protocol name and level
+        struct.pack_into("!BH", packet, offset + 7, flags, self.keep_alive)
+        offset += len(MQTT_HDR_CONNECT)
+        for field in fields:
+            packet[offset : offset + len(field)] = field
+            offset += len(field)
+        return packet
+
     def disconnect(self):
         """Disconnects the MiniMQTT client from the MQTT broker."""
         self.is_connected()
@@ -597,62 +785,153 @@ class MQTT:
                 raise MMQTTException("PINGRESP not returned from broker.")
         return rcs
 
-    # pylint: disable=too-many-branches, too-many-statements
     def publish(self, topic, msg, retain=False, qos=0):
         """Publishes a message to a topic provided.
 
-        :param str topic: Unique topic identifier.
-        :param str|int|float|bytes msg: Data to send to the broker.
+        :param str|bytes topic: Unique topic identifier. Passing it already
+            encoded as UTF-8 bytes saves encoding it on every publish.
+        :param str|int|float|bytes|bytearray msg: Data to send to the broker.
         :param bool retain: Whether the message is saved by the broker.
         :param int qos: Quality of Service level for the message, defaults to zero.
 
         """
         self.is_connected()
-        self._valid_topic(topic)
-        if "+" in topic or "#" in topic:
+        packet, payload = self._encode_publish(topic, msg, retain, qos)
+        self._send_packet(packet, payload)
+        if qos == 0 and self.on_publish is not None:
+            self.on_publish(self, self._user_data, topic, self._pid)
+        if qos == 1:
+            self._wait_for_pubacks({self._pid: topic})
+
+    def publish_multiple(self, messages):
+        """Publishes several messages, batching them into as few socket sends
+        as possible.
+
+        :param list messages: List of tuples containing the arguments of
+                              `publish()`: ``(topic, msg)``, ``(topic, msg, retain)``
+                              or ``(topic, msg, retain, qos)``.
+
+        """
+        self.is_connected()
+        published = []
+        pending = {}
+        batch = bytearray()
+        # Bound once, the send method is used several times per message
+        send = self._sock.send
+        for message in messages:
+            packet, payload = self._encode_publish(*message)
+            if payload is not None or len(batch) + len(packet) > MQTT_BATCH_SZ:
+                if batch:
+                    send(batch)
+                    batch = bytearray()
+                if payload is not None or len(packet) >= MQTT_BATCH_SZ:
+                    self._send_packet(packet, payload)
+                    packet = None
+            if packet is not None:
+                batch.extend(packet)
+            if len(message) > 3 and message[3] == 1:
+                pending[self._pid] = message[0]
+            else:
+                published.append((message[0], self._pid))
+        if batch:
+            send(batch)
+        if self.on_publish is not None:
+            for topic, pid in published:
+                self.on_publish(self, self._user_data, topic, pid)
+        self._wait_for_pubacks(pending)
+
+    def _send_packet(self, packet, payload=None):
+        """Sends an encoded packet, followed by its payload when that was kept
+        separate. Both go out in a single gather write where the socket
+        supports ``sendmsg()``.
+
+        :param packet: Encoded packet, or its headers when a payload is given.
+        :param payload: Payload of the packet, if not part of ``packet``.
+
+        """
+        if payload is None:
+            self._sock.send(packet)
+            return
+        if self._use_sendmsg:
+            try:
+                sent = self._sock.sendmsg((packet, payload))
+            except NotImplementedError:
+                # CPython's TLS sockets have sendmsg() but don't support it
+                self._use_sendmsg = False
+            else:
+                # Finish a short gather write with plain sends
+                if sent < len(packet):
+                    self._sock.send(memoryview(packet)[sent:])
+                    sent = len(packet)
+                sent -= len(packet)
+                if sent < len(payload):
+                    self._sock.send(memoryview(payload)[sent:])
+                return
+        self._sock.send(packet)
+        self._sock.send(payload)
+
+    # pylint: disable=too-many-branches, too-many-statements
+    def _encode_publish(self, topic, msg, retain=False, qos=0):
+        """Validates a message and encodes it as a PUBLISH packet.
+        Allocates a new packet id for QoS 1 messages.
+
+        Returns a ``(packet, payload)`` tuple, where ``packet`` may be a view of
+        a buffer reused by the next call. Messages up to ``MQTT_BATCH_SZ``
+        bytes are copied into the packet and ``payload`` is None, larger ones
+        are returned separately so they are not duplicated in memory.
+
+        :param str|bytes topic: Unique topic identifier.
+        :param str|int|float|bytes msg: Data to send to the broker.
+        :param bool retain: Whether the message is saved by the broker.
+        :param int qos: Quality of Service level for the message, defaults to zero.
+
+        """
+        topic_bytes = self._valid_topic(topic)
+        if b"+" in topic_bytes or b"#" in topic_bytes:
             raise MMQTTException("Publish topic can not contain wildcards.")
         # check msg/qos kwargs
         if msg is None:
             raise MMQTTException("Message can not be None.")
-        if isinstance(msg, (int, float)):
-            msg = str(msg).encode("ascii")
-        elif isinstance(msg, str):
-            msg = str(msg).encode("utf-8")
-        elif isinstance(msg, bytes):
-            pass
-        else:
-            raise MMQTTException("Invalid message data type.")
+        msg = _to_bytes(msg)
         if len(msg) > MQTT_MSG_MAX_SZ:
             raise MMQTTException("Message size larger than %d bytes." % MQTT_MSG_MAX_SZ)
-        assert (
-            0 <= qos <= 1
-        ), "Quality of Service Level 2 is unsupported by this library."
-
-        # fixed header. [3.3.1.2], [3.3.1.3]
-        pub_hdr_fixed = bytearray([0x30 | retain | qos << 1])
-
-        # variable header = 2-byte Topic length (big endian)
-        pub_hdr_var = bytearray(struct.pack(">H", len(topic.encode("utf-8"))))
-        pub_hdr_var.extend(topic.encode("utf-8"))  # Topic name
+        if not 0 <= qos <= 1:
+            raise MMQTTException(
+                "Quality of Service Level 2 is unsupported by this library."
+            )
 
-        remaining_length = 2 + len(msg) + len(topic.encode("utf-8"))
+        topic_len = len(topic_bytes)
+        remaining_length = 2 + len(msg) + topic_len
         if qos > 0:
             # packet identifier where QoS level is 1 or 2. [3.3.2.2]
             remaining_length += 2
             self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
-            pub_hdr_var.append(self._pid >> 8)
-            pub_hdr_var.append(self._pid & 0xFF)
-
-        # Calculate remaining length [2.2.3]
-        if remaining_length > 0x7F:
-            while remaining_length > 0:
-                encoded_byte = remaining_length % 0x80
-                remaining_length = remaining_length // 0x80
-                if remaining_length > 0:
-                    encoded_byte |= 0x80
-                pub_hdr_fixed.append(encoded_byte)
+
+        # Small messages are assembled with their headers so the whole packet
+        # goes out in a single send, large ones are sent after the headers
+        payload = msg if len(msg) > MQTT_BATCH_SZ else None
+        packet_len = 1 + _remlen_size(remaining_length) + remaining_length
+        if payload is not None:
+            packet_len -= len(msg)
+        # Packets that fit are built in the reusable transmit buffer
+        if packet_len <= MQTT_TX_BUF_SZ:
+            packet = self._tx_buf
         else:
-            pub_hdr_fixed.append(remaining_length)
+            packet = bytearray(packet_len)
+
+        # fixed header. [3.3.1.2], [3.3.1.3]
+        packet[0] = 0x30 | retain | qos << 1
+        offset = 1 + _encode_remlen(remaining_length, packet, 1)
+        # variable header = 2-byte Topic length (big endian) + Topic name
+        struct.pack_into("!H", packet, offset, topic_len)
+        offset += 2
+        packet[offset : offset + topic_len] = topic_bytes
+        offset += topic_len
+        if qos > 0:
+            struct.pack_into("!H", packet, offset, self._pid)
+            offset += 2
+        if payload is None:
+            packet[offset:packet_len] = msg
 
         if self.logger is not None:
             self.logger.debug(
@@ -663,30 +942,35 @@ class MQTT:
                 qos,
                 retain,
             )
-        self._sock.send(pub_hdr_fixed)
-        self._sock.send(pub_hdr_var)
-        self._sock.send(msg)
-        if qos == 0 and self.on_publish is not None:
-            self.on_publish(self, self._user_data, topic, self._pid)
-        if qos == 1:
-            stamp = time.monotonic()
-            while True:
-                op = self._wait_for_msg()
-                if op == 0x40:
-                    sz = self._sock_exact_recv(1)
-                    assert sz == b"\x02"
-                    rcv_pid = self._sock_exact_recv(2)
-                    rcv_pid = rcv_pid[0] << 0x08 | rcv_pid[1]
-                    if self._pid == rcv_pid:
-                        if self.on_publish is not None:
-                            self.on_publish(self, self._user_data, topic, rcv_pid)
-                        return
-
-                if op is None:
-                    if time.monotonic() - stamp > self._recv_timeout:
-                        raise MMQTTException(
-                            f"No data received from broker for {self._recv_timeout} seconds."
-                        )
+        if packet is self._tx_buf:
+            packet = self._tx_view[:packet_len]
+        return packet, payload
+
+    def _wait_for_pubacks(self, pending):
+        """Waits for the broker to acknowledge QoS 1 messages.
+
+        :param dict pending: Topics of the messages awaiting a PUBACK, by packet id.
+
+        """
+        stamp = time.monotonic()
+        while pending:
+            op = self._wait_for_msg()
+            if op == 0x40:
+                # remaining length and packet id, read together
+                sz, rcv_pid = struct.unpack_from("!BH", self._sock_exact_recv(3))
+                if sz != 0x02:
+                    raise MMQTTException(
+                        "Unexpected PUBACK length from broker: {}.".format(sz)
+                    )
+                topic = pending.pop(rcv_pid, None)
+                if topic is not None and self.on_publish is not None:
+                    self.on_publish(self, self._user_data, topic, rcv_pid)
+
+            if op is None:
+                if time.monotonic() - stamp > self._recv_timeout:
+                    raise MMQTTException(
+                        f"No data received from broker for {self._recv_timeout} seconds."
+                    )
 
     def subscribe(self, topic, qos=0):
         """Subscribes to a topic on the MQTT Broker.
@@ -707,31 +991,32 @@ class MQTT:
         topics = None
         if isinstance(topic, tuple):
             topic, qos = topic
-            self._valid_topic(topic)
-            self._valid_qos(qos)
         if isinstance(topic, str):
-            self._valid_topic(topic)
-            self._valid_qos(qos)
             topics = [(topic, qos)]
         if isinstance(topic, list):
-            topics = []
-            for t, q in topic:
-                self._valid_qos(q)
-                self._valid_topic(t)
-                topics.append((t, q))
-        # Assemble packet
-        packet_length = 2 + (2 * len(topics)) + (1 * len(topics))
-        packet_length += sum(len(topic.encode("utf-8")) for topic, qos in topics)
-        packet_length_byte = packet_length.to_bytes(1, "big")
-        self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
-        packet_id_bytes = self._pid.to_bytes(2, "big")
-        # Packet with variable and fixed headers
-        packet = MQTT_SUB + packet_length_byte + packet_id_bytes
-        # attaching topic and QOS level to the packet
+            topics = topic
+        encoded = []
         for t, q in topics:
-            topic_size = len(t.encode("utf-8")).to_bytes(2, "big")
-            qos_byte = q.to_bytes(1, "big")
-            packet += topic_size + t.encode() + qos_byte
+            self._valid_qos(q)
+            encoded.append((self._valid_topic(t), q))
+        # Assemble packet: fixed header, packet id, then length-prefixed
+        # topics each followed by their requested QoS byte
+        remaining_length = 2 + sum(3 + len(t) for t, q in encoded)
+        packet = bytearray(1 + _remlen_size(remaining_length) + remaining_length)
+        packet[0] = MQTT_SUB[0]
+        offset = 1 + _encode_remlen(remaining_length, packet, 1)
+        self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
+        # Callbacks run while waiting for the SUBACK may allocate new packet ids
+        pid = self._pid
+        struct.pack_into("!H", packet, offset, pid)
+        offset += 2
+        for t, q in encoded:
+            struct.pack_into("!H", packet, offset, len(t))
+            offset += 2
+            packet[offset : offset + len(t)] = t
+            offset += len(t)
+            packet[offset] = q & 0xFF
+            offset += 1
         if self.logger is not None:
             for t, q in topics:
                 self.logger.debug("SUBSCRIBING to topic %s with QoS %d", t, q)
@@ -740,10 +1025,14 @@ class MQTT:
         while True:
             op = self._wait_for_msg()
             if op == 0x90:
-                rc = self._sock_exact_recv(4)
-                assert rc[1] == packet[2] and rc[2] == packet[3]
-                if rc[3] == 0x80:
-                    raise MMQTTException("SUBACK Failure!")
+                # packet id, then one return code per topic [MQTT-3.9.3-1]
+                sz = self._recv_len()
+                rc = self._sock_exact_recv(sz)
+                if struct.unpack_from("!H", rc)[0] != pid:
+                    raise MMQTTException("SUBACK packet id does not match SUBSCRIBE.")
+                for i in range(2, sz):
+                    if rc[i] == 0x80:
+                        raise MMQTTException("SUBACK Failure!")
                 for t, q in topics:
                     if self.on_subscribe is not None:
                         self.on_subscribe(self, self._user_data, t, q)
@@ -764,45 +1053,47 @@ class MQTT:
         """
         topics = None
         if isinstance(topic, str):
-            self._valid_topic(topic)
-            topics = [(topic)]
+            topics = [topic]
         if isinstance(topic, list):
-            topics = []
-            for t in topic:
-                self._valid_topic(t)
-                topics.append((t))
+            topics = topic
+        encoded = [self._valid_topic(t) for t in topics]
         for t in topics:
             if t not in self._subscribed_topics:
                 raise MMQTTException(
                     "Topic must be subscribed to before attempting unsubscribe."
                 )
         # Assemble packet
-        packet_length = 2 + (2 * len(topics))
-        packet_length += sum(len(topic.encode("utf-8")) for topic in topics)
-        packet_length_byte = packet_length.to_bytes(1, "big")
+        remaining_length = 2 + sum(2 + len(t) for t in encoded)
+        packet = bytearray(1 + _remlen_size(remaining_length) + remaining_length)
+        packet[0] = MQTT_UNSUB[0]
+        offset = 1 + _encode_remlen(remaining_length, packet, 1)
         self._pid = self._pid + 1 if self._pid < 0xFFFF else 1
-        packet_id_bytes = self._pid.to_bytes(2, "big")
-        packet = MQTT_UNSUB + packet_length_byte + packet_id_bytes
-        for t in topics:
-            topic_size = len(t.encode("utf-8")).to_bytes(2, "big")
-            packet += topic_size + t.encode()
+        # Callbacks run while waiting for the UNSUBACK may allocate new packet ids
+        pid = self._pid
+        struct.pack_into("!H", packet, offset, pid)
+        offset += 2
+        for t in encoded:
+            struct.pack_into("!H", packet, offset, len(t))
+            offset += 2
+            packet[offset : offset + len(t)] = t
+            offset += len(t)
         if self.logger is not None:
             for t in topics:
                 self.logger.debug("UNSUBSCRIBING from topic %s", t)
         self._sock.send(packet)
         if self.logger is not None:
             self.logger.debug("Waiting for UNSUBACK...")
+        stamp = time.monotonic()
         while True:
-            stamp = time.monotonic()
             op = self._wait_for_msg()
             if op == 176:
-                rc = self._sock_exact_recv(3)
-                assert rc[0] == 0x02
+                sz, rcv_pid = struct.unpack_from("!BH", self._sock_exact_recv(3))
                 # [MQTT-3.32]
-                assert rc[1] == packet_id_bytes[0] and rc[2] == packet_id_bytes[1]
+                if sz != 0x02 or rcv_pid != pid:
+                    raise MMQTTException("Unexpected UNSUBACK from broker.")
                 for t in topics:
                     if self.on_unsubscribe is not None:
-                        self.on_unsubscribe(self, self._user_data, t, self._pid)
+                        self.on_unsubscribe(self, self._user_data, t, pid)
                     self._subscribed_topics.remove(t)
                 return
 
@@ -820,7 +1111,11 @@ class MQTT:
         """
         if self.logger is not None:
             self.logger.debug("Attempting to reconnect with MQTT broker")
-        self.connect()
+        self._reconnecting = True
+        try:
+            self.connect()
+        finally:
+            self._reconnecting = False
         if self.logger is not None:
             self.logger.debug("Reconnected with broker")
         if resub_topics:
@@ -828,11 +1123,16 @@ class MQTT:
                 self.logger.debug(
                     "Attempting to resubscribe to previously subscribed topics."
                 )
-            subscribed_topics = self._subscribed_topics.copy()
+            subscribed_topics = self._subscribed_topics
             self._subscribed_topics = []
-            while subscribed_topics:
-                feed = subscribed_topics.pop()
-                self.subscribe(feed)
+            resubscribed = 0
+            try:
+                for feed in subscribed_topics:
+                    self.subscribe(feed)
+                    resubscribed += 1
+            finally:
+                # Keep the topics not yet resubscribed for the next reconnect
+                self._subscribed_topics.extend(subscribed_topics[resubscribed:])
 
     def loop(self, timeout=1):
         """Non-blocking message loop. Use this method to
@@ -854,14 +1154,17 @@ class MQTT:
                 )
             rcs = self.ping()
             return rcs
-        self._sock.settimeout(timeout)
+        self._set_timeout(timeout)
         rc = self._wait_for_msg()
         return [rc] if rc else None
 
     def _wait_for_msg(self, timeout=0.1):
         """Reads and processes network events."""
+        if self._rx_pos < self._rx_end:
+            # The next packet was already read ahead, no need to poll the socket
+            res = self._sock_exact_recv(1)
         # CPython socket module contains a timeout attribute
-        if hasattr(self._socket_pool, "timeout"):
+        elif hasattr(self._socket_pool, "timeout"):
             try:
                 res = self._sock_exact_recv(1)
             except self._socket_pool.timeout:
@@ -876,11 +1179,38 @@ class MQTT:
                 raise MMQTTException from error
 
         # Block while we parse the rest of the response
-        self._sock.settimeout(timeout)
-        if res in [None, b""]:
-            # If we get here, it means that there is nothing to be received
-            return None
-        if res[0] == MQTT_PINGRESP:
+        self._set_timeout(timeout)
+        # _sock_exact_recv returns exactly one byte or raises, so there is
+        # always a packet type here. The receive buffer is reused by the reads
+        # below, keep the packet type
+        op = res[0]
+        # PUBLISH is by far the most frequent packet, test for it first
+        if op & 0xF0 == 0x30:
+            sz = self._recv_len()
+            # topic length MSB & LSB
+            topic_len = struct.unpack_from("!H", self._sock_exact_recv(2))[0]
+            topic, callbacks = self._lookup_topic(self._sock_exact_recv(topic_len))
+            sz -= topic_len + 2
+            # read the packet id, if any, with the message contents
+            raw_msg = self._sock_exact_recv(sz)
+            pid = 0
+            if op & 0x06:
+                pid = struct.unpack_from("!H", raw_msg)[0]
+                raw_msg = memoryview(raw_msg)[2:]
+            if self.logger is not None:
+                self.logger.debug(
+                    "Receiving SUBSCRIBE \nTopic: %s\nMsg: %s\n", topic, bytes(raw_msg)
+                )
+            self._handle_on_message(self, topic, raw_msg, callbacks)
+            if op & 0x06 == 0x02:
+                struct.pack_into("!H", self._puback, 2, pid)
+                self._sock.send(self._puback)
+            elif op & 6 == 4:
+                raise MMQTTException(
+                    "Quality of Service Level 2 is unsupported by this library."
+                )
+            return op
+        if op == MQTT_PINGRESP:
             if self.logger is not None:
                 self.logger.debug("Got PINGRESP")
             sz = self._sock_exact_recv(1)[0]
@@ -889,43 +1219,30 @@ class MQTT:
                     "Unexpected PINGRESP returned from broker: {}.".format(sz)
                 )
             return MQTT_PINGRESP
-        if res[0] & 0xF0 != 0x30:
-            return res[0]
-        sz = self._recv_len()
-        # topic length MSB & LSB
-        topic_len = self._sock_exact_recv(2)
-        topic_len = (topic_len[0] << 8) | topic_len[1]
-        topic = self._sock_exact_recv(topic_len)
-        topic = str(topic, "utf-8")
-        sz -= topic_len + 2
-        pid = 0
-        if res[0] & 0x06:
-            pid = self._sock_exact_recv(2)
-            pid = pid[0] << 0x08 | pid[1]
-            sz -= 0x02
-        # read message contents
-        raw_msg = self._sock_exact_recv(sz)
-        msg = raw_msg if self._use_binary_mode else str(raw_msg, "utf-8")
-        if self.logger is not None:
-            self.logger.debug(
-                "Receiving SUBSCRIBE \nTopic: %s\nMsg: %s\n", topic, raw_msg
-            )
-        self._handle_on_message(self, topic, msg)
-        if res[0] & 0x06 == 0x02:
-            pkt = bytearray(b"\x40\x02\0\0")
-            struct.pack_into("!H", pkt, 2, pid)
-            self._sock.send(pkt)
-        elif res[0] & 6 == 4:
-            assert 0
-        return res[0]
+        return op
+
+    def _set_timeout(self, timeout):
+        """Sets the socket timeout, skipping the socket call when it is unchanged.
+
+        :param float timeout: Socket timeout, in seconds.
+
+        """
+        if timeout != self._cur_timeout:
+            self._sock.settimeout(timeout)
+            self._cur_timeout = timeout
 
     def _recv_len(self):
         """Unpack MQTT message length."""
         n = 0
         sh = 0
-        b = bytearray(1)
+        rx_buf = self._rx_buf
         while True:
-            b = self._sock_exact_recv(1)[0]
+            # Decode straight from the read-ahead buffer while it has data
+            if self._rx_pos < self._rx_end:
+                b = rx_buf[self._rx_pos]
+                self._rx_pos += 1
+            else:
+                b = self._sock_exact_recv(1)[0]
             n |= (b & 0x7F) << sh
             if not b & 0x80:
                 return n
@@ -951,58 +1268,101 @@ class MQTT:
         wrapper for socket recv() to ensure that no less than the expected number of
         bytes is returned or trigger a timeout exception.
 
+        Data is received through a read-ahead buffer, so a whole packet usually
+        takes a single socket read. The result is a memoryview into that buffer,
+        or into a reused buffer for large messages, and is only valid until the
+        next read.
+
         :param int bufsize: number of bytes to receive
 
         """
-        if not self._backwards_compatible_sock:
-            # CPython/Socketpool Impl.
-            rc = bytearray(bufsize)
-            self._sock.recv_into(rc, bufsize)
-        else:  # ESP32SPI Impl.
-            stamp = time.monotonic()
-            read_timeout = self.keep_alive
-            # This will timeout with socket timeout (not keepalive timeout)
-            rc = self._sock.recv(bufsize)
-            if not rc:
-                if self.logger is not None:
-                    self.logger.debug("_sock_exact_recv timeout")
-                # If no bytes waiting, raise same exception as socketpool
-                raise OSError(errno.ETIMEDOUT)
-            # If any bytes waiting, try to read them all,
-            # or raise exception if wait longer than read_timeout
-            to_read = bufsize - len(rc)
-            assert to_read >= 0
-            read_timeout = self.keep_alive
-            while to_read > 0:
-                recv = self._sock.recv(to_read)
-                to_read -= len(recv)
-                rc += recv
+        pending = self._rx_end - self._rx_pos
+        if pending >= bufsize:
+            start = self._rx_pos
+            self._rx_pos += bufsize
+            return self._rx_view[start : self._rx_pos]
+        if bufsize > len(self._rx_buf):
+            # Too large for the read-ahead buffer, read straight into a
+            # buffer kept for large messages, grown to the largest one seen.
+            # Past MQTT_RX_LARGE_MAX the buffer is not kept, so a single
+            # huge message does not hold on to its memory.
+            large = self._rx_large
+            if large is None or len(large) < bufsize:
+                large = self._rx_large = None  # let the old buffer be collected first
+                large = bytearray(bufsize)
+                if bufsize <= MQTT_RX_LARGE_MAX:
+                    self._rx_large = large
+            large[:pending] = self._rx_buf[self._rx_pos : self._rx_end]
+            self._rx_pos = self._rx_end = 0
+            # Limit the reads to this message, the buffer may be larger and
+            # anything past it belongs to the next packets
+            rc = memoryview(large)[:bufsize]
+            self._recv_until(rc, pending, bufsize)
+            return rc
+        # Move pending bytes to the front of the buffer, then read ahead
+        if self._rx_pos:
+            self._rx_buf[:pending] = self._rx_buf[self._rx_pos : self._rx_end]
+            self._rx_pos = 0
+            self._rx_end = pending
+        self._rx_end = self._recv_until(self._rx_buf, pending, bufsize)
+        self._rx_pos = bufsize
+        return self._rx_view[:bufsize]
+
+    def _recv_until(self, buf, start, minimum):
+        """Receives into a buffer until at least a minimum number of bytes
+        are filled. Returns the number of bytes filled.
+
+        :param bytearray buf: Buffer to receive into.
+        :param int start: Number of bytes already filled in ``buf``.
+        :param int minimum: Number of bytes required in ``buf``.
+
+        """
+        view = memoryview(buf)
+        stamp = time.monotonic()
+        read_timeout = self.keep_alive
+        end = start
+        recv_into = self._recv_into
+        while end < minimum:
+            # ESP32SPI sockets wait for the whole size requested,
+            # so only ask them for what is needed
+            size = minimum - end if self._backwards_compatible_sock else 0
+            read = recv_into(view[end:], size)
+            if not read:
+                if end == 0:
+                    if self.logger is not None:
+                        self.logger.debug("_sock_exact_recv timeout")
+                    # If no bytes waiting, raise same exception as socketpool
+                    raise OSError(errno.ETIMEDOUT)
                 if time.monotonic() - stamp > read_timeout:
                     raise MMQTTException(
                         "Unable to receive {} bytes within {} seconds.".format(
-                            to_read, read_timeout
+                            minimum - end, read_timeout
                         )
                     )
-        return rc
+            end += read
+        return end
 
-    def _send_str(self, string):
-        """Encodes a string and sends it to a socket.
+    @staticmethod
+    def _encode_str(string):
+        """Encodes a string with its 2-byte length prefix [MQTT 1.5.3].
+        Returns None if no string is given.
 
-        :param str string: String to write to the socket.
+        :param str|bytes string: String to encode.
 
         """
+        if string is None:
+            return None
         if isinstance(string, str):
-            self._sock.send(struct.pack("!H", len(string.encode("utf-8"))))
-            self._sock.send(str.encode(string, "utf-8"))
-        else:
-            self._sock.send(struct.pack("!H", len(string)))
-            self._sock.send(string)
+            string = string.encode("utf-8")
+        return struct.pack("!H", len(string)) + string
 
     @staticmethod
     def _valid_topic(topic):
         """Validates if topic provided is proper MQTT topic format.
+        Returns the topic encoded as UTF-8.
 
-        :param str topic: Topic identifier
+        :param str|bytes|bytearray topic: Topic identifier, bytes and bytearray
+            are taken as already encoded.
 
         """
         if topic is None:
@@ -1010,9 +1370,18 @@ class MQTT:
         # [MQTT-4.7.3-1]
         if not topic:
             raise MMQTTException("Topic may not be empty.")
+        if isinstance(topic, str):
+            topic_bytes = topic.encode("utf-8")
+        elif isinstance(topic, bytes):
+            topic_bytes = topic
+        elif isinstance(topic, bytearray):
+            topic_bytes = bytes(topic)
+        else:
+            raise MMQTTException("Topic must be a str, bytes or bytearray.")
         # [MQTT-4.7.3-3]
-        if len(topic.encode("utf-8")) > MQTT_TOPIC_LENGTH_LIMIT:
+        if len(topic_bytes) > MQTT_TOPIC_LENGTH_LIMIT:
             raise MMQTTException("Topic length is too large.")
+        return topic_bytes
 
     @staticmethod
     def _valid_qos(qos_level):
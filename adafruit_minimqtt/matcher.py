@@ -18,7 +18,8 @@ class MQTTMatcher:
     Internally, MQTTMatcher use a prefix tree (trie) to store
     values associated with filters, and has an iter_match()
     method to iterate efficiently over all filters that match
-    some topic name.
+    some topic name. Filters without wildcards are kept in a
+    plain dict so they are matched with a single lookup.
     """
 
     # pylint: disable=too-few-public-methods
@@ -33,10 +34,18 @@ class MQTTMatcher:
 
     def __init__(self):
         self._root = self.Node()
+        self._exact = {}
+
+    @staticmethod
+    def _is_wildcard(key):
+        return "+" in key or "#" in key
 
     def __setitem__(self, key, value):
         """Add a topic filter :key to the prefix tree
         and associate it to :value"""
+        if not self._is_wildcard(key):
+            self._exact[key] = value
+            return
         node = self._root
         for sym in key.split("/"):
             node = node.children.setdefault(sym, self.Node())
@@ -44,6 +53,8 @@ class MQTTMatcher:
 
     def __getitem__(self, key):
         """Retrieve the value associated with some topic filter :key"""
+        if not self._is_wildcard(key):
+            return self._exact[key]
         try:
             node = self._root
             for sym in key.split("/"):
@@ -56,6 +67,9 @@ class MQTTMatcher:
 
     def __delitem__(self, key):
         """Delete the value associated with some topic filter :key"""
+        if not self._is_wildcard(key):
+            del self._exact[key]
+            return
         lst = []
         try:
             parent, node = None, self._root
@@ -74,6 +88,14 @@ class MQTTMatcher:
     def iter_match(self, topic):
         """Return an iterator on all values associated with filters
         that match the :topic"""
+        content = self._exact.get(topic)
+        if content is not None:
+            yield content
+        if self._root.children:
+            for content in self._iter_wildcard_match(topic):
+                yield content
+
+    def _iter_wildcard_match(self, topic):
         lst = topic.split("/")
         normal = not topic.startswith("$")
 
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+"""publish path tests"""
+
+# pylint: disable=protected-access
+
+import socket
+import struct
+
+import adafruit_minimqtt.adafruit_minimqtt as MQTT
+
+
+def _recv_exact(sock, size):
+    """Reads exactly size bytes from the socket."""
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        assert chunk, "connection closed"
+        data += chunk
+    return data
+
+
+def _recv_publish(sock):
+    """Reads a PUBLISH packet, as received by the broker.
+
+    Returns a ``(topic, payload, qos, pid)`` tuple, pid is None for QoS 0.
+    """
+    header = _recv_exact(sock, 1)[0]
+    assert header & 0xF0 == 0x30
+    qos = (header >> 1) & 0x03
+    remaining_length = 0
+    shift = 0
+    while True:
+        byte = _recv_exact(sock, 1)[0]
+        remaining_length |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+    body = _recv_exact(sock, remaining_length)
+    topic_len = struct.unpack_from("!H", body)[0]
+    topic = body[2 : 2 + topic_len].decode("utf-8")
+    offset = 2 + topic_len
+    pid = None
+    if qos:
+        pid = struct.unpack_from("!H", body, offset)[0]
+        offset += 2
+    return topic, body[offset:], qos, pid
+
+
+def test_publish_multiple():
+    """Mixed QoS messages crossing the batch size, acknowledged out of order."""
+    client_sock, broker_sock = socket.socketpair()
+    client_sock.settimeout(1)
+    broker_sock.settimeout(1)
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, socket_pool=socket)
+    mqtt_client._sock = client_sock
+    mqtt_client._is_connected = True
+    published = []
+    mqtt_client.on_publish = lambda client, userdata, topic, pid: published.append(
+        (topic, pid)
+    )
+
+    # several batches worth of small messages, and one larger than a batch
+    messages = []
+    for i in range(8):
+        messages.append(("t/{}".format(i), bytes([0x61 + i]) * 300, False, i % 2))
+    messages.insert(5, ("t/large", b"z" * (MQTT.MQTT_BATCH_SZ * 2), False, 1))
+    qos1_pids = list(range(1, 1 + sum(message[3] for message in messages)))
+
+    # the broker acknowledges the QoS 1 messages in reverse order
+    for pid in reversed(qos1_pids):
+        broker_sock.sendall(struct.pack("!BBH", 0x40, 0x02, pid))
+    mqtt_client.publish_multiple(messages)
+
+    received = [_recv_publish(broker_sock) for _ in messages]
+    pids = iter(qos1_pids)
+    expected = [
+        (topic, msg, qos, next(pids) if qos else None)
+        for topic, msg, _, qos in messages
+    ]
+    assert received == expected
+    # every message is reported, the QoS 1 ones in the order of their PUBACK
+    assert sorted(topic for topic, _ in published) == sorted(
+        message[0] for message in messages
+    )
+    topics = {pid: topic for topic, _, qos, pid in received if qos}
+    assert published[-len(qos1_pids) :] == [
+        (topics[pid], pid) for pid in reversed(qos1_pids)
+    ]
+    client_sock.close()
+    broker_sock.close()
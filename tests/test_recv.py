@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+"""receive path tests"""
+
+# pylint: disable=protected-access
+
+import socket
+import struct
+
+import adafruit_minimqtt.adafruit_minimqtt as MQTT
+
+
+def _publish_packet(topic, payload):
+    """Encodes a QoS 0 PUBLISH packet, as sent by the broker."""
+    topic = topic.encode("utf-8")
+    body = struct.pack("!H", len(topic)) + topic + payload
+    remaining_length = bytearray(4)
+    size = MQTT._encode_remlen(len(body), remaining_length, 0)
+    return b"\x30" + bytes(remaining_length[:size]) + body
+
+
+def test_recv_large_then_small():
+    """A large message must not swallow the packets received after it."""
+    client_sock, broker_sock = socket.socketpair()
+    client_sock.settimeout(1)
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, socket_pool=socket)
+    mqtt_client._sock = client_sock
+    received = []
+    mqtt_client.on_message = lambda client, topic, msg: received.append((topic, msg))
+
+    # a large message, then a smaller large message and a small one together
+    broker_sock.sendall(_publish_packet("big", b"a" * 5000))
+    assert mqtt_client._wait_for_msg() == 0x30
+    broker_sock.sendall(
+        _publish_packet("medium", b"b" * 300) + _publish_packet("small", b"c" * 10)
+    )
+    assert mqtt_client._wait_for_msg() == 0x30
+    assert mqtt_client._wait_for_msg() == 0x30
+
+    assert received == [
+        ("big", "a" * 5000),
+        ("medium", "b" * 300),
+        ("small", "c" * 10),
+    ]
+    client_sock.close()
+    broker_sock.close()
+
+
+def test_recv_oversize_not_kept():
+    """Buffers for messages over MQTT_RX_LARGE_MAX must not be kept."""
+    client_sock, broker_sock = socket.socketpair()
+    client_sock.settimeout(1)
+    mqtt_client = MQTT.MQTT(broker="localhost", port=1883, socket_pool=socket)
+    mqtt_client._sock = client_sock
+    received = []
+    mqtt_client.on_message = lambda client, topic, msg: received.append((topic, msg))
+
+    # a large message keeps its buffer for the next ones
+    broker_sock.sendall(_publish_packet("large", b"a" * 1000))
+    assert mqtt_client._wait_for_msg() == 0x30
+    assert len(mqtt_client._rx_large) >= 1000
+    # an oversize message is received in a buffer of its own, dropped after it
+    oversize = MQTT.MQTT_RX_LARGE_MAX * 4
+    broker_sock.sendall(_publish_packet("oversize", b"b" * oversize))
+    assert mqtt_client._wait_for_msg() == 0x30
+    assert mqtt_client._rx_large is None
+    broker_sock.sendall(_publish_packet("large", b"c" * 1000))
+    assert mqtt_client._wait_for_msg() == 0x30
+    assert len(mqtt_client._rx_large) <= MQTT.MQTT_RX_LARGE_MAX
+
+    assert received == [
+        ("large", "a" * 1000),
+        ("oversize", "b" * oversize),
+        ("large", "c" * 1000),
+    ]
+    client_sock.close()
+    broker_sock.close()